@@ -9,17 +9,26 @@ In this module:
   [!] These methods, while fast, are not always complete!
 '''
 
+import math
+import os
 import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import *
 from date_constraints import *
 from dataclasses import *
-from copy import *
 from csp_solver import *
 
 # CSP Local Search Constants
 # ---------------------------------------------------------------------------
 MAX_STEPS: int = 250
 MAX_RESTARTS: int = 50
+# Simulated annealing: temperature at the start of a restart (per meeting), and
+# the factor by which it cools after every step
+TEMPERATURE_PER_MEETING: float = 1.0
+COOLING_RATE: float = 0.995
+# Tabu search: how many recent moves (at most one per meeting) stay forbidden from being undone
+TABU_TENURE: int = 10
 
 # CSP Local Solver
 # ---------------------------------------------------------------------------
@@ -48,8 +57,8 @@ def local_solve(n_meetings: int, date_range: set[datetime], constraints: set[Dat
             The range of datetimes in which the n meetings must be scheduled; by default,
             these are each separated a day apart, but there's nothing to stop these from
             being meetings scheduled down to the second
-            [!] WARNING: AVOID ALIASING -- Remember that each variable must have its
-            own domain but what's provided is a single reference to a set of datetimes
+            [!] Domains are kept as int bitmasks over the sorted date range, so every
+            meeting can start from the same full mask without any aliasing concerns
         constraints (set[DateConstraint]):
             A set of DateConstraints specifying how the meetings must be scheduled.
             See DateConstraint documentation for different types of DateConstraints
@@ -65,5 +74,138 @@ def local_solve(n_meetings: int, date_range: set[datetime], constraints: set[Dat
             If the MAX_RESTARTS are reached:
                 Returns None
     '''
-    # [!] TODO: Implement the local search method of your choosing!
-    return []
+    global _worker_problem
+
+    # Index the dates and prune each meeting's domain by its unary constraints up front
+    dates: list[datetime] = sorted(date_range)
+    ordered: tuple[DateConstraint, ...] = order_constraints(constraints)
+    domains: list[int] = unary_masks(n_meetings, dates, ordered)
+
+    # A meeting with no date satisfying its unary constraints can never be scheduled
+    if not all(domains):
+        return None
+
+    # Only binary constraints remain to be repaired by the local search; resolve them to plain
+    # int tables up front: edges[var] = [(neighbor, supports[var_i] -> neighbor mask), ...]
+    values: list[list[int]] = [list(iter_bits(domain)) for domain in domains]
+    edges: list[list[tuple[int, tuple[int, ...]]]] = constraint_graph(
+        n_meetings, ordered, build_supports(ordered, dates)
+    )
+
+    # Most problems are solved by the first restart or two, so try one in this process before
+    # paying for worker processes; with a single CPU, run them all here
+    n_workers: int = min(os.cpu_count() or 1, MAX_RESTARTS)
+    n_local: int = MAX_RESTARTS if n_workers == 1 else 1
+    _init_worker(values, edges)
+    try:
+        for _ in range(n_local):
+            local_result: Optional[list[int]] = _one_restart(random.getrandbits(64))
+            if local_result is not None:
+                return [dates[i] for i in local_result]
+    finally:
+        _worker_problem = None
+    if n_local == MAX_RESTARTS:
+        return None
+
+    # The remaining restarts are independent, so spread them over worker processes, each with
+    # its own seed, and take the first one to succeed
+    with ProcessPoolExecutor(n_workers, initializer=_init_worker, initargs=(values, edges)) as pool:
+        futures = [pool.submit(_one_restart, random.getrandbits(64)) for _ in range(MAX_RESTARTS - n_local)]
+        for future in as_completed(futures):
+            result: Optional[list[int]] = future.result()
+            if result is not None:
+                # Cancel the restarts still pending; leaving the with block waits for the running ones
+                for pending in futures:
+                    pending.cancel()
+                return [dates[i] for i in result]
+    return None
+
+
+# Problem (values, edges, assignment and conflicts buffers) shared by every restart run in
+# this process, set by the pool initializer or by local_solve for its own restarts
+_worker_problem: Optional[tuple[list[list[int]], list[list[tuple[int, tuple[int, ...]]]], list[int], list[int]]] = None
+
+
+# Function to store the problem in a freshly started worker process
+def _init_worker(values: list[list[int]], edges: list[list[tuple[int, tuple[int, ...]]]]) -> None:
+    global _worker_problem
+    _worker_problem = (values, edges, [0] * len(values), [0] * len(values))
+
+
+# Function to run a single restart in a worker process with its own seeded RNG
+def _one_restart(seed: int) -> Optional[list[int]]:
+    assert _worker_problem is not None
+    values, edges, assignment, conflicts = _worker_problem
+    if _min_conflicts_core(values, edges, MAX_STEPS, random.Random(seed), assignment, conflicts):
+        return list(assignment)
+    return None
+
+
+# Function to run one random restart of the min-conflicts local search in place on the
+# given buffers, returning whether it found a solution within max_steps
+def _min_conflicts_core(
+        values: list[list[int]],
+        edges: list[list[tuple[int, tuple[int, ...]]]],
+        max_steps: int,
+        rng: random.Random,
+        assignment: list[int],
+        conflicts: list[int]
+) -> bool:
+    # Start from a random assignment and count each variable's violated constraints
+    for i, domain in enumerate(values):
+        assignment[i] = domain[rng.randrange(len(domain))]
+    for i in range(len(values)):
+        conflicts[i] = count_conflicts(i, assignment[i], assignment, edges)
+    temperature: float = len(values) * TEMPERATURE_PER_MEETING
+
+    # (var, value) pairs recently vacated, which var may not move back to for now
+    tabu: deque[tuple[int, int]] = deque(maxlen=min(TABU_TENURE, len(values)))
+
+    for _ in range(max_steps):
+        conflicted: list[int] = [var for var, count in enumerate(conflicts) if count]
+        if not conflicted:
+            return True
+
+        # Propose moving a random conflicted variable to its least-conflicted other non-tabu
+        # value, ties broken randomly
+        var: int = rng.choice(conflicted)
+        candidates: list[int] = [
+            value for value in values[var] if value != assignment[var] and (var, value) not in tabu
+        ]
+        if not candidates:
+            continue
+        scores: list[int] = [count_conflicts(var, value, assignment, edges) for value in candidates]
+        best_score: int = min(scores)
+        best_value: int = rng.choice([value for value, score in zip(candidates, scores) if score == best_score])
+
+        # Metropolis criterion: improving or sideways moves are always taken, while a worsening
+        # move is taken with probability exp(-delta / T) to escape local minima
+        delta: int = best_score - conflicts[var]
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            tabu.append((var, assignment[var]))
+            reassign(var, best_value, assignment, conflicts, edges)
+        temperature *= COOLING_RATE
+
+    return False
+
+
+# Function to count the binary constraints var = value would violate under the assignment
+def count_conflicts(var: int, value: int, assignment: list[int], edges: list[list[tuple[int, tuple[int, ...]]]]) -> int:
+    return sum(1 for neighbor, allowed in edges[var] if not (1 << assignment[neighbor]) & allowed[value])
+
+
+# Function to move var to value, updating the conflict counts of var and its neighbors incrementally
+def reassign(
+        var: int,
+        value: int,
+        assignment: list[int],
+        conflicts: list[int],
+        edges: list[list[tuple[int, tuple[int, ...]]]]
+) -> None:
+    old_value: int = assignment[var]
+    for neighbor, allowed in edges[var]:
+        neighbor_bit: int = 1 << assignment[neighbor]
+        delta: int = (not neighbor_bit & allowed[value]) - (not neighbor_bit & allowed[old_value])
+        conflicts[var] += delta
+        conflicts[neighbor] += delta
+    assignment[var] = value
@@ -1,6 +1,7 @@
 import unittest
 import pytest
 import math
+from unittest.mock import patch
 from datetime import *
 from date_constraints import *
 from csp_local_solver import *
@@ -169,3 +170,32 @@ class CSPLocalTests(unittest.TestCase):
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 149)
         n_meetings = N_CONS
         self.log_outcome(n_meetings, possible_dates, constraints)
+        
+    def test_csp_local_solver_t5(self) -> None:
+        # Every restart fails: no schedule puts each meeting before the other
+        constraints = {
+            DateConstraint(0, "<", 1),
+            DateConstraint(1, "<", 0)
+        }
+        possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
+        n_meetings = 2
+        self.log_outcome(n_meetings, possible_dates, constraints, solution_expected=False)
+        
+        # ...whether the restarts all run in this process or spill over into worker processes
+        for n_cpus in [1, 2]:
+            with patch("csp_local_solver.os.cpu_count", return_value=n_cpus):
+                self.assertIsNone(local_solve(n_meetings, possible_dates, constraints))
+        
+    def test_csp_local_solver_t6(self) -> None:
+        # Meeting 1 has no legal date at all, which is caught before any restart is run
+        constraints = {
+            DateConstraint(0, "<", 1),
+            DateConstraint(1, ">", datetime(2023, 1, 5))
+        }
+        possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
+        n_meetings = 2
+        with patch("csp_local_solver.ProcessPoolExecutor") as pool, \
+             patch("csp_local_solver._one_restart") as restart:
+            self.log_outcome(n_meetings, possible_dates, constraints, solution_expected=False)
+        pool.assert_not_called()
+        restart.assert_not_called()
@@ -7,202 +7,459 @@ that abides by some number of constraints.
 In this module:
 - A solver that uses the backtracking exact solver approach
 - Tools for pruning domains using node and arc consistency
+- Internally, domains are int bitmasks over a sorted list of the
+  candidate dates: bit i set means dates[i] is still in the domain
+- Dates are replaced by these sorted indices on the way in (index_dates)
+  and mapped back only for the returned solution, so every comparison in
+  propagation and search is between ints; since the indices preserve the
+  dates' order, they compare exactly like the dates (including any time
+  of day), unlike day ordinals
 '''
+from bisect import bisect_left, bisect_right
 from collections import deque
+from functools import lru_cache
 from datetime import *
 from date_constraints import *
 from dataclasses import *
-from copy import *
+
+
+# Bitmask Domain Helpers
+# ---------------------------------------------------------------------------
+# The possible outcomes of comparing two dates, as bits; each operator is the set of outcomes it accepts
+LESS: int = 1
+EQUAL: int = 2
+GREATER: int = 4
+OP_OUTCOMES: Dict[str, int] = {
+    "==": EQUAL, "!=": LESS | GREATER, ">": GREATER,
+    "<": LESS, ">=": GREATER | EQUAL, "<=": LESS | EQUAL
+}
+# How restrictive each operator is: "==" allows the fewest date pairs and "!=" the most
+OP_RESTRICTIVENESS: Dict[str, int] = {"==": 3, "<": 2, ">": 2, "<=": 1, ">=": 1, "!=": 0}
+
+
+# Function to reverse a set of outcomes, as when the compared operands are swapped
+def reverse_outcomes(outcomes: int) -> int:
+    return (outcomes & EQUAL) | (outcomes & LESS) << 2 | (outcomes & GREATER) >> 2
+
+
+# Function to map a date range onto sorted indices (bit positions)
+def index_dates(date_range: AbstractSet[datetime]) -> Tuple[List[datetime], Dict[datetime, int]]:
+    dates: List[datetime] = sorted(date_range)
+    idx_of: Dict[datetime, int] = {date: i for i, date in enumerate(dates)}
+    return dates, idx_of
+
+
+# Function to build the mask containing every one of n_dates indices
+def full_mask(n_dates: int) -> int:
+    return (1 << n_dates) - 1
+
+
+# Function to convert a set of datetimes into a domain bitmask
+def to_mask(domain: Set[datetime], idx_of: Dict[datetime, int]) -> int:
+    mask: int = 0
+    for date in domain:
+        mask |= 1 << idx_of[date]
+    return mask
+
+
+# Function to build the mask with exactly the bits lo through hi - 1 set
+def range_mask(lo: int, hi: int) -> int:
+    return ((1 << hi) - 1) ^ ((1 << lo) - 1)
+
+
+# Function to compute a unary constraint's allowed values over the sorted dates, as the ranges
+# below, equal to and above R_VAL that its operator accepts
+def unary_mask(constraint: DateConstraint, dates: List[datetime]) -> int:
+    r_date: datetime = cast(datetime, constraint.R_VAL)
+    lo: int = bisect_left(dates, r_date)
+    hi: int = bisect_right(dates, r_date)
+    outcomes: int = OP_OUTCOMES[constraint.OP]
+    mask: int = 0
+    if outcomes & LESS: mask |= range_mask(0, lo)
+    if outcomes & EQUAL: mask |= range_mask(lo, hi)
+    if outcomes & GREATER: mask |= range_mask(hi, len(dates))
+    return mask
+
+
+# Function to compute the tail values comparing to at least one value of the head domain with
+# one of the given outcomes, from the head domain's lowest and highest indices
+def supported_mask(outcomes: int, head_domain: int, n_dates: int) -> int:
+    if not head_domain:
+        return 0
+    mask: int = 0
+    if outcomes & LESS: mask |= range_mask(0, head_domain.bit_length() - 1)
+    if outcomes & EQUAL: mask |= head_domain
+    if outcomes & GREATER: mask |= range_mask((head_domain & -head_domain).bit_length(), n_dates)
+    return mask
+
+
+# Function to iterate over the indices of the set bits of a domain bitmask
+def iter_bits(mask: int) -> Iterator[int]:
+    while mask:
+        # Isolate the lowest set bit, yield its index, then clear it
+        low: int = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+# The number of support tables kept between solves: the six operators' over a few date range sizes
+SUPPORT_TABLE_CACHE_SIZE: int = 6 * 4
+
+
+# Function to build the (memoized, read-only) support table of an operator's outcomes over
+# n_dates sorted dates: table[tail_i] = mask of the head indices that satisfy it
+@lru_cache(maxsize=SUPPORT_TABLE_CACHE_SIZE)
+def support_table(outcomes: int, n_dates: int) -> Tuple[int, ...]:
+    reversed_outcomes: int = reverse_outcomes(outcomes)
+    return tuple(supported_mask(reversed_outcomes, 1 << tail_i, n_dates) for tail_i in range(n_dates))
+
+
+# Function to look up the support tables of every binary constraint and its reverse:
+# supports[constraint][tail_i] = mask of the head indices that satisfy it
+def build_supports(constraints: Tuple[DateConstraint, ...], dates: List[datetime]) -> Dict[DateConstraint, Tuple[int, ...]]:
+    supports: Dict[DateConstraint, Tuple[int, ...]] = {}
+    for constraint in constraints:
+        if constraint.arity() == 2:
+            for directed in (constraint, constraint.get_reverse()):
+                supports[directed] = support_table(OP_OUTCOMES[directed.OP], len(dates))
+    return supports
+
+
+# Function to rank how restrictive a constraint's operator is, so checking restrictive
+# constraints first finds failures sooner
+def restrictiveness(constraint: DateConstraint) -> int:
+    return OP_RESTRICTIVENESS[constraint.OP]
+
+
+# Function to freeze the constraints into a tuple: unary before binary, the most restrictive
+# first within each, so iteration is deterministic and cheaper than over a set
+def order_constraints(constraints: AbstractSet[DateConstraint]) -> Tuple[DateConstraint, ...]:
+    return tuple(sorted(
+        constraints, key=lambda constraint: (constraint.arity(), -restrictiveness(constraint), str(constraint))
+    ))
+
+
+# Function to build the constraint graph: edges[var] lists one (neighbor, supports[var_i] ->
+# neighbor mask) pair per neighbor, ANDing the tables of parallel constraints
+def constraint_graph(
+        n_meetings: int,
+        constraints: Tuple[DateConstraint, ...],
+        supports: Dict[DateConstraint, Tuple[int, ...]]
+) -> List[List[Tuple[int, Tuple[int, ...]]]]:
+    tables: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+    for constraint in constraints:
+        if constraint.arity() == 2 and constraint.R_VAL != constraint.L_VAL:
+            for directed in (constraint, constraint.get_reverse()):
+                pair: Tuple[int, int] = (directed.L_VAL, cast(int, directed.R_VAL))
+                merged: Optional[Tuple[int, ...]] = tables.get(pair)
+                table: Tuple[int, ...] = supports[directed]
+                tables[pair] = table if merged is None else tuple(a & b for a, b in zip(merged, table))
+
+    edges: List[List[Tuple[int, Tuple[int, ...]]]] = [[] for _ in range(n_meetings)]
+    for (var, neighbor), table in tables.items():
+        edges[var].append((neighbor, table))
+    return edges
 
 
 # CSP Backtracking Solver
 # ---------------------------------------------------------------------------
+# Sentinel date index for a meeting that has not been assigned yet
+UNASSIGNED: int = -1
+
+
 # Function to solve the constraint satisfaction problem
 def solve(n_meetings: int, date_range: Set[datetime], constraints: Set[DateConstraint]) -> Optional[List[datetime]]:
-    # Initialize assignment and domains
-    assignment: List[Optional[datetime]] = [None] * n_meetings
-    domains: List[Set[datetime]] = [set(date_range) for _ in range(n_meetings)]
-
-    # Apply node consistency and arc consistency to prune domains
-    node_consistency(domains, constraints)
-    arc_consistency(domains, constraints)
+    # Fix the constraints in a deterministic, most-restrictive-first order
+    dates: List[datetime] = sorted(date_range)
+    ordered: Tuple[DateConstraint, ...] = order_constraints(constraints)
+
+    # Initialize assignment (date indices) and domains; each domain starts out node consistent,
+    # as the fold of its meeting's unary constraints computed once here
+    assignment: List[int] = [UNASSIGNED] * n_meetings
+    domains: List[int] = unary_masks(n_meetings, dates, ordered)
+
+    # Apply arc consistency to prune domains; a wiped-out domain means there is no solution
+    propagate_arcs(domains, dates, ordered)
+    if not all(domains):
+        return None
 
-    # Perform recursive backtracking
-    result: Optional[List[datetime]] = recursive_backtracker(
-        assignment, list(range(n_meetings)), domains, constraints, depth=n_meetings
+    # A meeting left with a single date is settled: arc consistency already removed every
+    # neighbor value conflicting with it, so its constraints hold whatever the search picks
+    # for the rest and drop out of the search along with it
+    for var, domain in enumerate(domains):
+        if not domain & (domain - 1):
+            assignment[var] = domain.bit_length() - 1
+    open_variables: List[int] = [var for var in range(n_meetings) if assignment[var] == UNASSIGNED]
+    open_constraints: Tuple[DateConstraint, ...] = tuple(
+        constraint for constraint in ordered if constraint.arity() == 2
+        and assignment[constraint.L_VAL] == UNASSIGNED and assignment[cast(int, constraint.R_VAL)] == UNASSIGNED
     )
-    return result
 
+    # Perform backtracking search over the remaining binary constraints' support tables
+    supports: Dict[DateConstraint, Tuple[int, ...]] = build_supports(open_constraints, dates)
+    edges: List[List[Tuple[int, Tuple[int, ...]]]] = constraint_graph(n_meetings, open_constraints, supports)
+    result: Optional[List[int]] = backtracker(assignment, open_variables, domains, edges)
+    return [dates[i] for i in result] if result is not None else None
 
-# Recursive backtracking function
-def recursive_backtracker(
-        assignment: List[Optional[datetime]],
+
+# Backtracking function with forward checking and conflict-directed backjumping, driven by
+# an explicit stack of (variable, remaining values, trail, conflict set) frames
+def backtracker(
+        assignment: List[int],
         variables: List[int],
-        domains: List[Set[datetime]],
-        constraints: Set[DateConstraint],
-        depth: int
-) -> Optional[List[datetime]]:
-    # Base case: If all variables are assigned, return the assignment
-    if all(assignment):
-        return cast(List[datetime], assignment)  # cast to remove None values
-
-    # Limit recursion depth to avoid out of bounds error
-    if depth <= 0:
-        return None
+        domains: List[int],
+        edges: List[List[Tuple[int, Tuple[int, ...]]]]
+) -> Optional[List[int]]:
+    # Base case: If there is nothing to assign, the empty assignment is the solution
+    if not variables:
+        return list(assignment)
+
+    # Forward checking reorders the edge lists as it learns which edges fail, so work on a copy
+    edges = [list(var_edges) for var_edges in edges]
+    depth_of: List[int] = [UNASSIGNED] * len(assignment)
+    size_weight: int = degree_bound(edges)
+    priority: List[int] = mrv_priorities(domains, edges, size_weight)
+    # Priorities only go down during the search, so this ranks assigned variables above the rest
+    assigned_priority: int = max(priority, default=0) + 1
+    support_count: List[List[int]] = support_counts(domains, edges)
+    first_var: int = select_unassigned_variable(variables, priority)
+    depth_of[first_var] = 0
+    stack: List[Tuple[int, Iterator[int], List[Tuple[int, int, int]], Set[int]]] = [
+        (first_var, iter(order_domain_values(first_var, domains, support_count)), [], set())
+    ]
+
+    while stack:
+        var, values, trail, conflicts = stack[-1]
+
+        # Backtrack out of the value previously tried for this variable, if any
+        assignment[var] = UNASSIGNED
+        undo_trail(trail, domains, priority)
+
+        # If all values in the domain failed, the assigned neighbors that pruned this variable's
+        # domain are to blame too; jump back to the deepest frame to blame, or fail outright
+        # when the failure does not depend on any earlier assignment
+        value: Optional[int] = next(values, None)
+        if value is None:
+            conflicts.update(assigned_neighbor_depths(var, assignment, depth_of, edges))
+            if not conflicts:
+                return None
+            target: int = max(conflicts)
+            while len(stack) > target + 1:
+                var, _, trail, _ = stack.pop()
+                assignment[var] = UNASSIGNED
+                undo_trail(trail, domains, priority)
+            conflicts.discard(target)
+            stack[target][3].update(conflicts)
+            continue
+
+        # Prune the unassigned neighbors' domains, remembering the old masks on the trail
+        wiped_out: Optional[int] = forward_check(
+            var, value, assignment, domains, edges, trail, priority, size_weight
+        )
+        if wiped_out is None:
+            # Assign the value to the variable, taking it out of the running for selection until
+            # its trail is undone
+            assignment[var] = value
+            trail.append((var, domains[var], priority[var]))
+            priority[var] = assigned_priority
+
+            # If all variables are assigned, return a copy of the assignment
+            if len(stack) == len(variables):
+                return list(assignment)
+
+            # Otherwise descend into the next unassigned variable
+            next_var: int = select_unassigned_variable(variables, priority)
+            depth_of[next_var] = len(stack)
+            stack.append((next_var, iter(order_domain_values(next_var, domains, support_count)), [], set()))
+        else:
+            # The wiped-out neighbor's domain was narrowed by its assigned neighbors, so they
+            # share the blame for this value failing
+            conflicts.update(assigned_neighbor_depths(wiped_out, assignment, depth_of, edges))
 
-    # Select the next unassigned variable
-    next_var: Optional[int] = cast(Optional[int], select_unassigned_variable(variables, assignment))
+    # If we get here, the whole search space failed
+    return None
 
-    if next_var is not None:
-        # Iterate through the values in the domain of the selected variable
-        for value in order_domain_values(domains[next_var]):
-            # Assign the value to the variable
-            assignment[next_var] = value
 
-            # Check if the assignment is consistent with constraints
-            if is_assignment_consistent(assignment, constraints):
-                # Recursive call with reduced depth
-                result: Optional[List[datetime]] = recursive_backtracker(
-                    assignment, variables, domains, constraints, depth - 1
-                )
+# Function to find the frame depths of the assigned neighbors of var
+def assigned_neighbor_depths(
+        var: int,
+        assignment: List[int],
+        depth_of: List[int],
+        edges: List[List[Tuple[int, Tuple[int, ...]]]]
+) -> Set[int]:
+    return {depth_of[neighbor] for neighbor, _ in edges[var] if assignment[neighbor] != UNASSIGNED}
 
-                # Check if the result is not a failure
-                if result:
-                    return result
 
-            # If we get here, the assignment failed, so backtrack
-            assignment[next_var] = None
+# Function to compute a bound above every variable's degree, the weight of one domain value
+# in the MRV priorities
+def degree_bound(edges: List[List[Tuple[int, Tuple[int, ...]]]]) -> int:
+    return max(map(len, edges), default=0) + 1
 
-    # If we get here, all values in the domain failed, so backtrack
-    return None
 
+# Function to compute each variable's MRV priority as a single int: its domain size times
+# size_weight, minus its degree
+def mrv_priorities(domains: List[int], edges: List[List[Tuple[int, Tuple[int, ...]]]], size_weight: int) -> List[int]:
+    return [domain.bit_count() * size_weight - len(var_edges) for domain, var_edges in zip(domains, edges)]
 
-# Function to select the next unassigned variable
-def select_unassigned_variable(variables: List[int], assignment: List[Optional[datetime]]) -> int:
-    # Find unassigned variables
-    unassigned_variables: List[int] = [var for var in variables if assignment[var] is None]
 
-    # Check if all variables are assigned
-    if not unassigned_variables:
+# Function to select the next unassigned variable: Minimum Remaining Values, ties broken by
+# degree, both folded into the priorities that forward checking keeps up to date
+def select_unassigned_variable(variables: List[int], priority: List[int]) -> int:
+    # Check if there is any variable to pick from
+    if not variables:
         raise ValueError("All variables are assigned")
 
-    # Return the first unassigned variable
-    return unassigned_variables[0]
+    # Return the variable with the smallest priority; assigned variables rank above every
+    # unassigned one, so this is always unassigned while any are left
+    return min(variables, key=priority.__getitem__)
+
+
+# Function to count, for each variable and value, the neighbor values supporting it in the
+# domains the search starts from
+def support_counts(domains: List[int], edges: List[List[Tuple[int, Tuple[int, ...]]]]) -> List[List[int]]:
+    support_count: List[List[int]] = []
+    for domain, var_edges in zip(domains, edges):
+        counts: List[int] = [0] * domain.bit_length()
+        for value in iter_bits(domain):
+            counts[value] = sum((domains[neighbor] & allowed[value]).bit_count() for neighbor, allowed in var_edges)
+        support_count.append(counts)
+    return support_count
+
+
+# Function to order domain values by Least Constraining Value: the values with the most
+# supports at the start of the search come first
+def order_domain_values(var: int, domains: List[int], support_count: List[List[int]]) -> List[int]:
+    return sorted(iter_bits(domains[var]), key=support_count[var].__getitem__, reverse=True)
+
+
+# Function to forward check var = value: every unassigned neighbor keeps only the values
+# supporting it; returns the first neighbor wiped out, or None when the check passes
+def forward_check(
+        var: int,
+        value: int,
+        assignment: List[int],
+        domains: List[int],
+        edges: List[List[Tuple[int, Tuple[int, ...]]]],
+        trail: List[Tuple[int, int, int]],
+        priority: List[int],
+        size_weight: int
+) -> Optional[int]:
+    var_edges: List[Tuple[int, Tuple[int, ...]]] = edges[var]
+    for k, (neighbor, allowed) in enumerate(var_edges):
+        if assignment[neighbor] == UNASSIGNED:
+            old_domain: int = domains[neighbor]
+            new_domain: int = old_domain & allowed[value]
+            if new_domain != old_domain:
+                old_priority: int = priority[neighbor]
+                trail.append((neighbor, old_domain, old_priority))
+                domains[neighbor] = new_domain
+                priority[neighbor] = old_priority - (old_domain ^ new_domain).bit_count() * size_weight
+                if not new_domain:
+                    # Move the edge that failed to the front, so the edges that fail most
+                    # often get checked first and later checks exit earlier
+                    if k:
+                        var_edges.insert(0, var_edges.pop(k))
+                    return neighbor
+    return None
 
 
-# Function to order domain values (convert set to list)
-def order_domain_values(domain: Set[datetime]) -> List[datetime]:
-    return list(domain)
+# Function to restore the domains and priorities recorded on a forward-checking trail, newest first
+def undo_trail(trail: List[Tuple[int, int, int]], domains: List[int], priority: List[int]) -> None:
+    while trail:
+        var, old_domain, old_priority = trail.pop()
+        domains[var] = old_domain
+        priority[var] = old_priority
 
 
-# Function to check if the current assignment is consistent with constraints
-def is_assignment_consistent(assignment: List[Optional[datetime]], constraints: Set[DateConstraint]) -> bool:
-    for constraint in constraints:
-        # Check if the constraint is satisfied by the current assignment
-        if not constraint.is_satisfied_by_assignment(assignment):
-            return False
-    return True
+# Function to apply node consistency to prune set domains in place
+def node_consistency(domains: List[Set[datetime]], constraints: Set[DateConstraint]) -> None:
+    dates, idx_of = index_dates(set().union(*domains))
+    masks: List[int] = [to_mask(domain, idx_of) for domain in domains]
+    prune_unary(masks, dates, order_constraints(constraints))
+    write_back(domains, masks, idx_of)
 
 
-# Function to apply node consistency to prune domains
-def node_consistency(domains: List[Set[datetime]], constraints: Set[DateConstraint]) -> None:
+# Function to compute each meeting's node-consistent mask from its unary constraints,
+# including binary constraints relating the meeting to itself
+def unary_masks(n_meetings: int, dates: List[datetime], constraints: Tuple[DateConstraint, ...]) -> List[int]:
+    masks: List[int] = [full_mask(len(dates))] * n_meetings
     for constraint in constraints:
-        # Check if the constraint is unary
         if constraint.arity() == 1:
-            # For unary constraints, prune the domain based on constraint satisfaction
-            meeting_index: int = constraint.L_VAL
-            domain: Set[datetime] = domains[meeting_index]
-            new_domain: Set[datetime] = set()
+            masks[constraint.L_VAL] &= unary_mask(constraint, dates)
+        elif constraint.R_VAL == constraint.L_VAL and not OP_OUTCOMES[constraint.OP] & EQUAL:
+            masks[constraint.L_VAL] = 0
+    return masks
 
-            for value in domain:
-                # Check if the value satisfies the unary constraint
-                if constraint.is_satisfied_by_values(value):
-                    new_domain.add(value)
 
-            # Update the domain with the pruned values
-            domains[meeting_index] = new_domain
+# Function to prune bitmask domains based on unary constraints
+def prune_unary(domains: List[int], dates: List[datetime], constraints: Tuple[DateConstraint, ...]) -> None:
+    for var, mask in enumerate(unary_masks(len(domains), dates, constraints)):
+        domains[var] &= mask
 
 
-class Arc:
-    def __init__(self, constraint: DateConstraint):
-        self.CONSTRAINT: DateConstraint = constraint
-        self.TAIL: int = constraint.L_VAL
-        self.HEAD: Optional[int] = constraint.R_VAL if constraint.arity() == 2 else None
+# Function to replace each of the caller's set domains with a new set of the values its bitmask kept
+def write_back(domains: List[Set[datetime]], masks: List[int], idx_of: Dict[datetime, int]) -> None:
+    for var, (domain, mask) in enumerate(zip(domains, masks)):
+        domains[var] = {date for date in domain if mask >> idx_of[date] & 1}
 
-    def __eq__(self, other: Any) -> bool:
-        if other is None:
-            return False
-        if not isinstance(other, Arc):
-            return False
-        return self.CONSTRAINT == other.CONSTRAINT and self.TAIL == other.TAIL and self.HEAD == other.HEAD
 
-    def __hash__(self) -> int:
-        return hash((self.CONSTRAINT, self.TAIL, self.HEAD))
-
-    def __str__(self) -> str:
-        return f"Arc[{self.CONSTRAINT}, ({self.TAIL} -> {self.HEAD})]"
-
-    def __repr__(self) -> str:
-        return self.__str__()
-
-
-# Function to initialize arcs based on constraints
-def initialize_arcs(constraints: Set[DateConstraint]) -> Set[Arc]:
-    arcs: Set[Arc] = set()
+# Function to initialize the directed arcs (cons_id, tail, head) for every binary constraint;
+# each constraint's two directions get ids 2k and 2k + 1, so an arc's reverse is cons_id ^ 1
+def initialize_arcs(constraints: Tuple[DateConstraint, ...]) -> List[DateConstraint]:
+    directed: List[DateConstraint] = []
     for constraint in constraints:
-        # If the constraint has arity 2, add arcs in both directions
         if constraint.arity() == 2:
-            arcs.add(Arc(constraint))
-            arcs.add(Arc(constraint.get_reverse()))
-        else:
-            # If the constraint has arity 1, add a single arc
-            arcs.add(Arc(constraint))
-    return arcs
+            directed.append(constraint)
+            directed.append(constraint.get_reverse())
+    return directed
 
 
-# Function to enforce arc consistency on domains
+# Function to enforce arc consistency on set domains in place
 def arc_consistency(domains: List[Set[datetime]], constraints: Set[DateConstraint]) -> None:
-    # Initialize a set of arcs based on constraints
-    arc_set: Set[Arc] = initialize_arcs(constraints)
-
-    # Continue until the set of arcs is not empty
-    while arc_set:
-        # Pop an arc from the set
-        curr_arc: Arc = arc_set.pop()
-
-        # Remove inconsistent values and update the set of arcs
-        if remove_inconsistent_values(domains, curr_arc):
-            for arc in get_arcs_related_to_tail(curr_arc, constraints):
-                arc_set.add(arc)
-
-
-# Function to remove inconsistent values from the tail of the arc
-def remove_inconsistent_values(domains: List[Set[datetime]], curr_arc: Arc) -> bool:
-    removed: bool = False
-    for tail_val in set(domains[curr_arc.TAIL]):
-        # Check if there is no satisfying head value for the tail value
-        if not exists_satisfying_head_value(tail_val, curr_arc, domains):
-            # Remove the inconsistent value from the domain
-            domains[curr_arc.TAIL].remove(tail_val)
-            removed = True
-
-    return removed
-
-
-# Function to check if there exists a satisfying head value for the tail value in the given arc
-def exists_satisfying_head_value(tail_val: datetime, curr_arc: Arc, domains: List[Set[datetime]]) -> bool:
-    if curr_arc.HEAD is not None:
-        # Check if there exists a satisfying head value in the domain
-        for head_val in domains[curr_arc.HEAD]:
-            if curr_arc.CONSTRAINT.is_satisfied_by_values(tail_val, head_val):
-                return True
-    elif curr_arc.HEAD is None:
-        # For unary arcs, check if the tail value satisfies the constraint
-        return curr_arc.CONSTRAINT.is_satisfied_by_values(tail_val)
-
+    dates, idx_of = index_dates(set().union(*domains))
+    masks: List[int] = [to_mask(domain, idx_of) for domain in domains]
+    ordered: Tuple[DateConstraint, ...] = order_constraints(constraints)
+    prune_unary(masks, dates, ordered)
+    propagate_arcs(masks, dates, ordered)
+    write_back(domains, masks, idx_of)
+
+
+# Function to enforce arc consistency (AC-3) on bitmask domains; unary constraints are arcs
+# with no head, so callers settle them beforehand
+def propagate_arcs(domains: List[int], dates: List[datetime], constraints: Tuple[DateConstraint, ...]) -> None:
+    # Initialize the arcs, their operators' outcomes, and the arcs pointing into each variable
+    directed: List[DateConstraint] = initialize_arcs(constraints)
+    outcomes: List[int] = [OP_OUTCOMES[constraint.OP] for constraint in directed]
+    arcs: List[Tuple[int, int, int]] = [
+        (cons_id, constraint.L_VAL, cast(int, constraint.R_VAL)) for cons_id, constraint in enumerate(directed)
+    ]
+    neighbors: List[List[Tuple[int, int, int]]] = [[] for _ in domains]
+    for arc in arcs:
+        neighbors[arc[2]].append(arc)
+
+    # Continue until the queue of arcs is empty; queued[cons_id] keeps each arc in the queue at most once
+    queue: Deque[Tuple[int, int, int]] = deque(arcs)
+    queued: List[bool] = [True] * len(arcs)
+    while queue:
+        cons_id, tail, head = queue.popleft()
+        queued[cons_id] = False
+
+        # Remove inconsistent values and re-queue the arcs into the tail, except this arc's reverse
+        if remove_inconsistent_values(domains, tail, head, outcomes[cons_id], len(dates)):
+            for arc in neighbors[tail]:
+                if not queued[arc[0]] and arc[0] != cons_id ^ 1:
+                    queued[arc[0]] = True
+                    queue.append(arc)
+
+
+# Function to remove inconsistent values from the tail of the arc: the tail keeps exactly the
+# values supported by some remaining head value, all found with a few whole-mask operations
+def remove_inconsistent_values(domains: List[int], tail: int, head: int, outcomes: int, n_dates: int) -> bool:
+    tail_domain: int = domains[tail]
+    consistent: int = tail_domain & supported_mask(outcomes, domains[head], n_dates)
+
+    # Remove all the inconsistent values from the domain at once
+    if consistent != tail_domain:
+        domains[tail] = consistent
+        return True
     return False
-
-
-# Function to get arcs related to the tail of the given arc
-def get_arcs_related_to_tail(curr_arc: Arc, constraints: Set[DateConstraint]) -> List[Arc]:
-    return [Arc(constraint) for constraint in constraints if constraint.L_VAL == curr_arc.HEAD]
\ No newline at end of file
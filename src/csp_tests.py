@@ -75,7 +75,7 @@ class CSPTests(unittest.TestCase):
         # One Meeting with possible values ranging from 2023-1-1 to 2023-1-5
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
         n_meetings = 1
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         node_consistency(domains, constraints)
         
@@ -88,7 +88,7 @@ class CSPTests(unittest.TestCase):
         }
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
         n_meetings = 1
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         node_consistency(domains, constraints)
         
@@ -103,7 +103,7 @@ class CSPTests(unittest.TestCase):
         }
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
         n_meetings = 3
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         node_consistency(domains, constraints)
         
@@ -120,7 +120,7 @@ class CSPTests(unittest.TestCase):
         }
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
         n_meetings = 3
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         node_consistency(domains, constraints)
         
@@ -130,13 +130,28 @@ class CSPTests(unittest.TestCase):
         self.assertNotIn(datetime(2023, 1, 3), domains[0])
         self.assertIn(datetime(2023, 1, 1), domains[1])
         
+    def test_csp_node_consistency_t4(self) -> None:
+        constraints = {
+            DateConstraint(0, "==", datetime(2023, 1, 1)),
+            DateConstraint(1, "==", datetime(2023, 1, 2))
+        }
+        
+        # Both meetings start from the very same set, which each must prune independently
+        shared_domain = self.generate_dates(datetime(2023, 1, 1), 5)
+        domains: list[set[datetime]] = [shared_domain, shared_domain]
+        
+        node_consistency(domains, constraints)
+        
+        self.assertEqual({datetime(2023, 1, 1)}, domains[0])
+        self.assertEqual({datetime(2023, 1, 2)}, domains[1])
+        
     def test_csp_arc_consistency_t0(self) -> None:
         constraints = {
             DateConstraint(0, "!=", 1)
         }
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
         n_meetings = 2
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         arc_consistency(domains, constraints)
         
@@ -149,7 +164,7 @@ class CSPTests(unittest.TestCase):
         }
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
         n_meetings = 2
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         arc_consistency(domains, constraints)
         
@@ -165,7 +180,7 @@ class CSPTests(unittest.TestCase):
         }
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
         n_meetings = 2
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         # AC here should nuke both domains because it's unsatisfiable!
         arc_consistency(domains, constraints)
@@ -181,7 +196,7 @@ class CSPTests(unittest.TestCase):
         }
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
         n_meetings = 3
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         # AC here should nuke ALL domains because it's unsatisfiable!
         arc_consistency(domains, constraints)
@@ -198,7 +213,7 @@ class CSPTests(unittest.TestCase):
         }
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 2)
         n_meetings = 3
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         arc_consistency(domains, constraints)
         
@@ -217,7 +232,7 @@ class CSPTests(unittest.TestCase):
         }
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 2)
         n_meetings = 3
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         # C-C-C-COMBO CONSISTENCY!
         node_consistency(domains, constraints)
@@ -239,7 +254,7 @@ class CSPTests(unittest.TestCase):
         }
         possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
         n_meetings = 3
-        domains: list[set[datetime]] = [deepcopy(possible_dates) for n in range(n_meetings)]
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
         
         # C-C-C-COMBO CONSISTENCY!
         node_consistency(domains, constraints)
@@ -423,4 +438,97 @@ class CSPTests(unittest.TestCase):
         # Example Solution:
         # [2023-05-31, 2023-04-30, 2023-04-28, 2023-04-29, 2023-05-30]
         self.validate_solution(n_meetings, solution, constraints)
-        
\ No newline at end of file
+        
+
+    def test_csp_backtracking_t10(self) -> None:
+        # Meetings 0-4 must all be on different days out of 4, which arc consistency alone
+        # cannot rule out; meetings 5-24 form a chain of alternating days out of the first 3,
+        # so the search schedules them first, having the fewest options
+        constraints = {DateConstraint(i, "!=", j) for i in range(5) for j in range(i + 1, 5)}
+        for i in range(5, 25):
+            constraints.add(DateConstraint(i, "<=", datetime(2023, 1, 3)))
+        for i in range(5, 24):
+            constraints.add(DateConstraint(i, "!=", i + 1))
+        
+        # [!] Without backjumping, the search would retry the first 5 meetings under every
+        # one of the chain's 3 * 2^19 schedules, none of which has anything to do with their failure
+        possible_dates = self.generate_dates(datetime(2023, 1, 1), 4)
+        n_meetings = 25
+        solution = solve(n_meetings, possible_dates, constraints)
+        self.validate_solution(n_meetings, solution, constraints, solution_expected=False)
+        
+    def test_csp_self_constraint_t0(self) -> None:
+        possible_dates = self.generate_dates(datetime(2023, 1, 1), 5)
+        n_meetings = 2
+        
+        # A meeting can never be scheduled on a different date than itself
+        constraints = {DateConstraint(0, "!=", 0)}
+        domains: list[set[datetime]] = [set(possible_dates) for n in range(n_meetings)]
+        node_consistency(domains, constraints)
+        self.assertEqual(0, len(domains[0]))
+        self.assertEqual(5, len(domains[1]))
+        self.assertIsNone(solve(n_meetings, possible_dates, constraints))
+        
+        # ...but it is always scheduled on the same date as itself
+        constraints = {DateConstraint(0, "<=", 0), DateConstraint(1, ">", 0)}
+        solution = solve(n_meetings, possible_dates, constraints)
+        self.validate_solution(n_meetings, solution, constraints)
+        
+    # DateConstraint and Bitmask Helper Tests
+    # ---------------------------------------------------------------------------
+    def test_date_constraint_reverse_t0(self) -> None:
+        constraint = DateConstraint(0, "<", 1)
+        reverse = constraint.get_reverse()
+        
+        # The reverse swaps the meetings and mirrors the operator, and is built only once
+        self.assertEqual(DateConstraint(1, ">", 0), reverse)
+        self.assertIs(reverse, constraint.get_reverse())
+        self.assertEqual(constraint, reverse.get_reverse())
+        
+        # Reversing both ways agrees with the original on every pair of dates
+        dates = sorted(self.generate_dates(datetime(2023, 1, 1), 3))
+        for op in ["==", "!=", ">", "<", ">=", "<="]:
+            constraint = DateConstraint(0, op, 1)
+            for left_date in dates:
+                for right_date in dates:
+                    satisfied = constraint.is_satisfied_by_values(left_date, right_date)
+                    self.assertEqual(satisfied, constraint.get_reverse().is_satisfied_by_values(right_date, left_date))
+                    self.assertEqual(satisfied, constraint.get_reverse().get_reverse().is_satisfied_by_values(left_date, right_date))
+        
+        # Unary constraints have no reverse, and no constraint can be changed once built
+        with self.assertRaises(ValueError):
+            DateConstraint(0, "<", datetime(2023, 1, 1)).get_reverse()
+        with self.assertRaises(AttributeError):
+            constraint.OP = "<"
+        
+    def test_csp_bitmask_helpers_t0(self) -> None:
+        # Every other day, so unary constraints can also name dates between and around them
+        dates = sorted(datetime(2023, 1, 1) + timedelta(days=2 * x) for x in range(6))
+        n_dates = len(dates)
+        r_dates = [datetime(2023, 1, 1) + timedelta(days=x) for x in range(-1, 2 * n_dates + 1)]
+        for op, outcomes in OP_OUTCOMES.items():
+            binary = DateConstraint(0, op, 1)
+            
+            # Reversing the outcomes twice is a no-op, and once gives the reversed operator's
+            self.assertEqual(outcomes, reverse_outcomes(reverse_outcomes(outcomes)))
+            self.assertEqual(OP_OUTCOMES[binary.get_reverse().OP], reverse_outcomes(outcomes))
+            
+            # unary_mask keeps exactly the dates satisfying the unary constraint
+            for r_date in r_dates:
+                unary = DateConstraint(0, op, r_date)
+                expected = sum(1 << i for i, date in enumerate(dates) if unary.is_satisfied_by_values(date))
+                self.assertEqual(expected, unary_mask(unary, dates), str(unary))
+            
+            # support_table[x] holds exactly the y with x OP y
+            table = support_table(outcomes, n_dates)
+            for x in range(n_dates):
+                expected = sum(1 << y for y in range(n_dates) if binary.is_satisfied_by_values(dates[x], dates[y]))
+                self.assertEqual(expected, table[x], str(binary) + " at " + str(x))
+            
+            # supported_mask holds exactly the x with x OP y for some y in the head domain
+            for head_domain in range(1 << n_dates):
+                expected = sum(
+                    1 << x for x in range(n_dates)
+                    if any(binary.is_satisfied_by_values(dates[x], dates[y]) for y in iter_bits(head_domain))
+                )
+                self.assertEqual(expected, supported_mask(outcomes, head_domain, n_dates), str(binary) + " over " + bin(head_domain))
@@ -1,3 +1,4 @@
+import operator
 from dataclasses import *
 from datetime import *
 from typing import *
@@ -19,11 +20,32 @@ class DateConstraint:
         ARITY (int):
             How many variables appear in the DateConstraint: 1 for unary, 2
             for binary
+    
+    [!] DateConstraints are immutable: assigning or deleting any attribute after
+    construction raises an AttributeError
     '''
     
     # The only valid operators to compare datetimes in this class
     _VALID_OPS = ["==", "!=", ">", "<", ">=", "<="]
     
+    # The C-level comparator implementing each valid operator
+    _OP_TABLE: dict[str, Callable[[datetime, datetime], bool]] = {
+        "==": operator.eq, "!=": operator.ne, ">": operator.gt,
+        "<": operator.lt, ">=": operator.ge, "<=": operator.le
+    }
+    
+    # The fields, set once by _set_fields; __setattr__ refuses any later assignment
+    L_VAL: int
+    OP: str
+    R_VAL: Union[int, datetime]
+    ARITY: int
+    _cmp: Callable[[datetime, datetime], bool]
+    _sym_op: str
+    _hash: int
+    
+    # The reverse of a binary DateConstraint, built by get_reverse on first use
+    _reverse: Optional["DateConstraint"]
+    
     def __init__(self, l_val: int, op: str, r_val: Union[int, datetime]):
         '''
         Constructs a new DateConstraint with the given variables/datetime and relational
@@ -62,10 +84,7 @@ class DateConstraint:
             raise ValueError("[X] Date constraint R_VAL " + str(r_val) + " for binary constraints must be an int >= 0.")
         if not isinstance(r_val, int) and not isinstance(r_val, datetime):
             raise ValueError("[X] Date constraint R_VAL " + str(r_val) + " must be either a datetime (unary constraint) or int (binary constraint).")
-        self.L_VAL: int = l_val
-        self.OP: str = op
-        self.R_VAL: Union[int, datetime] = r_val
-        self.ARITY = 1 if isinstance(r_val, datetime) else 2
+        self._set_fields(l_val, op, r_val)
     
     def arity(self) -> int:
         '''
@@ -106,9 +125,14 @@ class DateConstraint:
                     assignment = [datetime(2023, 1, 1), datetime(2023, 1, 2)]
                     constraint = 1 == 0
         '''
-        left_date = assignment[self.L_VAL] if self.L_VAL < len(assignment) else None
-        right_date = self.R_VAL if isinstance(self.R_VAL, datetime) else \
-                     (assignment[self.R_VAL] if self.R_VAL < len(assignment) else None)
+        n_assigned = len(assignment)
+        left_date = assignment[self.L_VAL] if self.L_VAL < n_assigned else None
+        right_date: Optional[datetime]
+        if self.ARITY == 1:
+            right_date = cast(datetime, self.R_VAL)
+        else:
+            r_val = cast(int, self.R_VAL)
+            right_date = assignment[r_val] if r_val < n_assigned else None
         if left_date is None or right_date is None:
             return True
         
@@ -145,10 +169,9 @@ class DateConstraint:
             binary_dc.is_satisfied_by_values(datetime(2023, 1, 5), datetime(2023, 1, 4)) => False
         '''
         if right_date is None:
-            if isinstance(self.R_VAL, datetime):
-                right_date = self.R_VAL
-            else:
+            if self.ARITY == 2:
                 raise ValueError("[X] Can only leave right_date parameter unspecified for Unary Date Constraints")
+            right_date = cast(datetime, self.R_VAL)
         return self._dates_satisfy(left_date, right_date)
     
     def get_reverse(self) -> "DateConstraint":
@@ -163,8 +186,9 @@ class DateConstraint:
         
         Returns:
             DateConstraint:
-                A new DateConstraint that is logically equivalent, but syntactically reversed,
-                from the current one.
+                A DateConstraint that is logically equivalent, but syntactically reversed,
+                from the current one. It is built on the first call and returned by every
+                later one; reversing it again gives a DateConstraint equal to this one.
         
         Example:
             binary_dc = DateConstraint(0, "<", 1)
@@ -173,11 +197,54 @@ class DateConstraint:
         '''
         if not isinstance(self.R_VAL, int):
             raise ValueError("[X] The get_reverse method can only be used for BINARY constraints")
-        return DateConstraint(self.R_VAL, self._get_symmetrical_op(), self.L_VAL)
+        reverse = self._reverse
+        if reverse is None:
+            reverse = DateConstraint._unchecked_new(self.R_VAL, self._sym_op, self.L_VAL)
+            object.__setattr__(self, "_reverse", reverse)
+        return reverse
     
     # "Private" Helpers Below
     # [!] You should not need to call any of these directly in your implementation
     # ---------------------------------------------------------------------------
+    @classmethod
+    def _unchecked_new(cls, l_val: int, op: str, r_val: Union[int, datetime]) -> "DateConstraint":
+        '''
+        Constructs a DateConstraint without validating its arguments, for internal callers
+        deriving it from an already-validated DateConstraint (e.g., its reverse).
+        
+        Parameters:
+            l_val, op, r_val:
+                As in the constructor, and already known to be valid
+        
+        Returns:
+            DateConstraint:
+                The new DateConstraint
+        '''
+        constraint = cls.__new__(cls)
+        constraint._set_fields(l_val, op, r_val)
+        return constraint
+    
+    def _set_fields(self, l_val: int, op: str, r_val: Union[int, datetime]) -> None:
+        '''
+        Sets this DateConstraint's fields, along with everything derived from them.
+        
+        [!] DateConstraints are immutable (see __setattr__), so the derived values are
+        resolved once, here, rather than on every comparison, reversal, or set lookup; the
+        reverse is built on first use
+        
+        Parameters:
+            l_val, op, r_val:
+                As in the constructor
+        '''
+        object.__setattr__(self, "L_VAL", l_val)
+        object.__setattr__(self, "OP", op)
+        object.__setattr__(self, "R_VAL", r_val)
+        object.__setattr__(self, "ARITY", 1 if isinstance(r_val, datetime) else 2)
+        object.__setattr__(self, "_cmp", DateConstraint._OP_TABLE[op])
+        object.__setattr__(self, "_sym_op", self._get_symmetrical_op())
+        object.__setattr__(self, "_hash", hash((l_val, op, r_val)))
+        object.__setattr__(self, "_reverse", None)
+    
     def _dates_satisfy(self, left_date: datetime, right_date: datetime) -> bool:
         '''
         Evaluates the given datetimes based on this constraint's operator.
@@ -192,13 +259,7 @@ class DateConstraint:
             Whether or not the constraint is satisfied when the given dates are inserted
             for its L_VAL and R_VAL
         '''
-        if self.OP == "==": return left_date == right_date
-        if self.OP == "!=": return not left_date == right_date
-        if self.OP == ">": return left_date > right_date
-        if self.OP == "<": return left_date < right_date
-        if self.OP == ">=": return left_date >= right_date
-        if self.OP == "<=": return left_date <= right_date
-        return False
+        return self._cmp(left_date, right_date)
         
     def _get_symmetrical_op(self) -> str:
         '''
@@ -225,5 +286,11 @@ class DateConstraint:
         return self.L_VAL == other.L_VAL and self.OP == other.OP and self.R_VAL == other.R_VAL
     
     def __hash__(self) -> int:
-        return hash((self.L_VAL, self.OP, self.R_VAL))
+        return self._hash
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("[X] DateConstraints are immutable; cannot set " + name + ".")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("[X] DateConstraints are immutable; cannot delete " + name + ".")
     
\ No newline at end of file